@@ -10,7 +10,6 @@ This module provides endpoints for:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
 import traceback
@@ -450,11 +449,11 @@ async def stream_evaluation(
                     message=f"Evaluation already {status}",
                     progress_percent=100 if status == "completed" else -1,
                 )
-                yield f"data: {json.dumps(fallback_event.to_dict())}\n\n"
+                yield fallback_event.to_sse_bytes()
                 return
 
             async for event in event_channel.subscribe(evaluation_id):
-                yield f"data: {json.dumps(event.to_dict())}\n\n"
+                yield event.to_sse_bytes()
 
                 if event.event_type in (
                     EventType.EVALUATION_COMPLETE,
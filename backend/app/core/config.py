@@ -80,6 +80,10 @@ class Settings(BaseSettings):
     TECHNIQUE_CACHE_TTL_HOURS: int = 24
     TECHNIQUE_CACHE_ENABLED: bool = True
 
+    # Sommelier Result Cache (exact match on the rendered prompt)
+    SOMMELIER_CACHE_ENABLED: bool = False
+    SOMMELIER_CACHE_TTL_HOURS: int = 24
+
     @field_validator("MAX_CONCURRENT_TECHNIQUES")
     @classmethod
     def validate_max_concurrent(cls, v: int) -> int:
@@ -7,6 +7,8 @@ from typing import Any, Dict, Optional
 from langchain_core.runnables import RunnableConfig
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
+from app.core.config import settings
+from app.graph.nodes.cache import get_sommelier_cache
 from app.graph.state import EvaluationState
 from app.graph.schemas import SommelierOutput
 from app.providers.llm import build_llm, extract_text_content
@@ -190,6 +192,29 @@ class BaseSommelierNode(ABC):
         }
         messages = prompt.format_messages(**prompt_inputs)
 
+        cache_key = None
+        if settings.SOMMELIER_CACHE_ENABLED:
+            cache_key = get_sommelier_cache().make_key(
+                self.name, provider, model, temperature, max_output_tokens, messages
+            )
+            cached = get_sommelier_cache().get(cache_key)
+            if cached is not None:
+                trace = observability["trace_metadata"][self.name]
+                trace["completed_at"] = datetime.now(timezone.utc).isoformat()
+                trace["from_cache"] = True
+                if evaluation_id:
+                    event_channel.emit_sync(
+                        evaluation_id,
+                        create_sommelier_event(
+                            evaluation_id=evaluation_id,
+                            sommelier=self.name,
+                            event_type="sommelier_complete",
+                            progress_percent=progress_config["complete"],
+                            message=f"{self.name} analysis complete (cached)",
+                        ),
+                    )
+                return {f"{self.name}_result": cached, **observability}
+
         def on_retry(attempt: int, delay: float, msg: str) -> None:
             logger.info(f"{self.name}: {msg}")
             if evaluation_id:
@@ -270,8 +295,12 @@ class BaseSommelierNode(ABC):
                     ),
                 )
 
+            result_data = result.model_dump()
+            if cache_key is not None:
+                get_sommelier_cache().set(cache_key, result_data)
+
             return {
-                f"{self.name}_result": result.dict(),
+                f"{self.name}_result": result_data,
                 **observability,
             }
 
@@ -0,0 +1,85 @@
+"""In-memory result cache for sommelier nodes."""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
+
+from langchain_core.messages import BaseMessage
+
+
+class SommelierResultCache:
+    """In-memory exact-match cache for parsed sommelier results.
+
+    Keys hash the fully rendered prompt messages together with the model
+    settings, so any change to repo content, criteria or model is a miss.
+    Entries expire after the TTL and the oldest entry is evicted once
+    max_entries is reached.
+    """
+
+    def __init__(self, ttl_hours: int = 24, max_entries: int = 1024):
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+        self._ttl = timedelta(hours=ttl_hours)
+        self._max_entries = max_entries
+
+    @staticmethod
+    def make_key(
+        sommelier: str,
+        provider: str,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_output_tokens: Optional[int],
+        messages: Sequence[BaseMessage],
+    ) -> str:
+        """Hash the sommelier, model settings and rendered messages."""
+        payload = json.dumps(
+            {
+                "sommelier": sommelier,
+                "provider": provider,
+                "model": model,
+                "temperature": temperature,
+                "max_output_tokens": max_output_tokens,
+                "messages": [[m.type, m.content] for m in messages],
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if datetime.now(timezone.utc) - entry["created_at"] > self._ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return copy.deepcopy(entry["result"])
+
+    def set(self, key: str, result: dict[str, Any]) -> None:
+        self._cache[key] = {
+            "result": copy.deepcopy(result),
+            "created_at": datetime.now(timezone.utc),
+        }
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+_cache_instance: Optional[SommelierResultCache] = None
+
+
+def get_sommelier_cache() -> SommelierResultCache:
+    global _cache_instance
+    if _cache_instance is None:
+        from app.core.config import settings
+
+        _cache_instance = SommelierResultCache(
+            ttl_hours=settings.SOMMELIER_CACHE_TTL_HOURS
+        )
+    return _cache_instance
@@ -210,7 +210,7 @@ class JeanPierreNode(BaseSommelierNode):
                 )
 
             return {
-                f"{self.name}_result": result.dict(),
+                f"{self.name}_result": result.model_dump(),
                 **observability,
             }
 
@@ -1,4 +1,8 @@
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -14,8 +18,12 @@ logger = logging.getLogger(__name__)
 _README_MAX_LEN = 2000
 _FILE_TREE_MAX_LEN = 1000
 _METADATA_MAX_LEN = 500
+# Entries are float32 arrays (~12 KB at 3072 dims), so 256 stays near 3 MB.
+_EMBEDDING_CACHE_MAX_ENTRIES = 256
 
 _genai_client = None
+_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
 
 
 def _get_genai_client():
@@ -66,7 +74,7 @@ def _cosine_similarity(vec_a: np.ndarray, vec_b: np.ndarray) -> float:
     return float(dot_product / (norm_a * norm_b))
 
 
-def _get_embeddings(texts: List[str]) -> List[List[float]]:
+def _embed_texts(texts: List[str]) -> List[List[float]]:
     client = _get_genai_client()
     response = client.models.embed_content(
         model=settings.RAG_EMBEDDING_MODEL,
@@ -75,22 +83,56 @@ def _get_embeddings(texts: List[str]) -> List[List[float]]:
     return [emb.values for emb in response.embeddings]
 
 
+def _embedding_key(text: str) -> str:
+    payload = f"{settings.RAG_EMBEDDING_MODEL}\0{text}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _as_cached_vector(values: List[float]) -> np.ndarray:
+    vec = np.asarray(values, dtype=np.float32)
+    vec.setflags(write=False)
+    return vec
+
+
+def _get_embeddings(texts: List[str]) -> List[np.ndarray]:
+    keys = [_embedding_key(text) for text in texts]
+    found: Dict[str, np.ndarray] = {}
+    missing: Dict[str, str] = {}
+    with _embedding_cache_lock:
+        for key, text in zip(keys, texts):
+            if key in _embedding_cache:
+                _embedding_cache.move_to_end(key)
+                found[key] = _embedding_cache[key]
+            else:
+                missing[key] = text
+
+    if missing:
+        embedded = _embed_texts(list(missing.values()))
+        found.update(zip(missing.keys(), map(_as_cached_vector, embedded)))
+        with _embedding_cache_lock:
+            for key in missing:
+                _embedding_cache[key] = found[key]
+            while len(_embedding_cache) > _EMBEDDING_CACHE_MAX_ENTRIES:
+                _embedding_cache.popitem(last=False)
+
+    return [found[key] for key in keys]
+
+
 def _similarity_search(
-    query_embedding: List[float],
-    doc_embeddings: List[List[float]],
+    query_embedding: np.ndarray,
+    doc_embeddings: List[np.ndarray],
     docs: List[Dict[str, str]],
     top_k: int,
 ) -> List[Dict[str, str]]:
-    query_vec = np.array(query_embedding)
-    similarities = []
+    query_vec = np.asarray(query_embedding, dtype=np.float32)
+    doc_matrix = np.asarray(doc_embeddings, dtype=np.float32)
 
-    for idx, doc_emb in enumerate(doc_embeddings):
-        doc_vec = np.array(doc_emb)
-        sim = _cosine_similarity(query_vec, doc_vec)
-        similarities.append((idx, sim))
+    norms = np.linalg.norm(doc_matrix, axis=1) * np.linalg.norm(query_vec)
+    dots = doc_matrix @ query_vec
+    similarities = np.divide(dots, norms, out=np.zeros_like(dots), where=norms != 0)
 
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    top_indices = [idx for idx, _ in similarities[:top_k]]
+    # Stable sort keeps document order for equal scores.
+    top_indices = np.argsort(-similarities, kind="stable")[:top_k]
 
     return [
         {"text": docs[idx]["text"], "source": docs[idx]["source"]}
@@ -182,7 +224,7 @@ async def rag_enrich(
         texts = [d["text"] for d in docs]
         all_texts = [query] + texts
 
-        all_embeddings = _get_embeddings(all_texts)
+        all_embeddings = await asyncio.to_thread(_get_embeddings, all_texts)
         query_embedding = all_embeddings[0]
         doc_embeddings = all_embeddings[1:]
 
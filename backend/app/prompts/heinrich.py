@@ -5,9 +5,12 @@ Color: #2F4F4F
 Style: Rigor, thorough, methodical.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_heinrich_prompt() -> ChatPromptTemplate:
     """Create Heinrich's evaluation prompt template.
 
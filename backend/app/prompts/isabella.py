@@ -5,9 +5,12 @@ Color: #C41E3A
 Style: Poetic, aesthetic-focused, craft appreciation.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_isabella_prompt() -> ChatPromptTemplate:
     """Create Isabella's evaluation prompt template.
 
@@ -5,9 +5,12 @@ Color: #4169E1
 Style: Wise, synthesizing, final verdict.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_jeanpierre_prompt() -> ChatPromptTemplate:
     """Create Jean-Pierre's evaluation prompt template.
 
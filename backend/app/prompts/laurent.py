@@ -5,9 +5,12 @@ Color: #228B22
 Style: Pragmatic, detail-oriented, implementation.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_laurent_prompt() -> ChatPromptTemplate:
     """Create Laurent's evaluation prompt template.
 
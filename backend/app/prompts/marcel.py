@@ -5,9 +5,12 @@ Color: #8B7355
 Style: Precise, data-driven, architectural.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_marcel_prompt() -> ChatPromptTemplate:
     """Create Marcel's evaluation prompt template.
 
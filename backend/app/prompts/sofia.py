@@ -5,9 +5,12 @@ Color: #DAA520
 Style: Curious, forward-looking, growth-focused.
 """
 
+from functools import lru_cache
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
+@lru_cache(maxsize=1)
 def get_sofia_prompt() -> ChatPromptTemplate:
     """Create Sofia's evaluation prompt template.
 
@@ -1,11 +1,16 @@
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
 MAX_FIELD_LENGTH = 10000
 
+_SCAN_CACHE_MAX_ENTRIES = 256
+
 INJECTION_PATTERNS = [
     r"(?i)ignore\s+(all\s+)?previous\s+instructions",
     r"(?i)you\s+are\s+now\s+a\s+different",
@@ -22,42 +27,96 @@ INJECTION_PATTERNS = [
 ]
 
 
-@dataclass
-class ContentValidation:
-    is_suspicious: bool = False
-    flags: list[str] = field(default_factory=list)
-    risk_level: str = "none"  # none, low, medium, high
-    patterns_found: int = 0
+def _scoped(pattern: str) -> str:
+    """Turn a leading global (?i) into a scoped (?i:...) group."""
+    if pattern.startswith("(?i)"):
+        return f"(?i:{pattern[4:]})"
+    return pattern
 
 
-def sanitize_repo_content(content: str) -> str:
-    """Strip known prompt injection patterns and truncate."""
-    if not content:
-        return content
+# One alternation over all patterns, used to redact in a single pass.
+_COMBINED_PATTERN = re.compile("|".join(_scoped(p) for p in INJECTION_PATTERNS))
 
-    if len(content) > MAX_FIELD_LENGTH:
-        content = content[:MAX_FIELD_LENGTH]
+# Compiled individually so validation counts each pattern's own matches,
+# including text that overlaps a match of another pattern.
+_PATTERNS = [re.compile(p) for p in INJECTION_PATTERNS]
 
-    for pattern in INJECTION_PATTERNS:
-        if re.search(pattern, content):
-            logger.warning(f"Prompt injection pattern found: {pattern[:50]}")
-            content = re.sub(pattern, "[REDACTED]", content)
+# Every INJECTION_PATTERNS entry contains one of these literals; content
+# holding none of them cannot match, so the regex pass is skipped.
+_ANCHORS = (
+    "ignore",
+    "different",
+    "override",
+    "score",
+    "evaluator",
+    "forget",
+    "instruction",
+    "pretend",
+    "disregard",
+)
 
-    return content
+# Characters that (?i) matches against "i"/"s" but str.lower() does not fold.
+_ANCHOR_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
 
 
-def validate_repo_content(content: str) -> ContentValidation:
-    """Check for suspicious patterns without modifying content."""
-    result = ContentValidation()
+def _may_contain_injection(content: str) -> bool:
+    folded = content.translate(_ANCHOR_FOLD).lower()
+    return any(anchor in folded for anchor in _ANCHORS)
 
-    if not content:
-        return result
 
-    for pattern in INJECTION_PATTERNS:
-        matches = re.findall(pattern, content)
-        if matches:
-            result.flags.append(f"Pattern: {pattern[:60]}")
-            result.patterns_found += len(matches)
+_ScanResult = tuple[str, int, tuple[tuple[int, int], ...]]
+
+# blake2b digest of scanned content -> (redacted content, redactions,
+# per-pattern match counts)
+_scan_cache: OrderedDict[bytes, _ScanResult] = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+def _scan(content: str) -> _ScanResult:
+    """Redact injection matches in one combined pass and count them, memoized.
+
+    Per-pattern counts come from each pattern's own findall, and only run
+    when the combined pass redacted something.
+    """
+    key = hashlib.blake2b(
+        content.encode(errors="surrogatepass"), digest_size=16
+    ).digest()
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None:
+            _scan_cache.move_to_end(key)
+            return cached
+
+    sanitized, redactions = _COMBINED_PATTERN.subn("[REDACTED]", content)
+    counts: tuple[tuple[int, int], ...] = ()
+    if redactions:
+        counts = tuple(
+            (idx, n)
+            for idx, pattern in enumerate(_PATTERNS)
+            if (n := len(pattern.findall(content)))
+        )
+
+    result = (sanitized, redactions, counts)
+    with _scan_cache_lock:
+        _scan_cache[key] = result
+        while len(_scan_cache) > _SCAN_CACHE_MAX_ENTRIES:
+            _scan_cache.popitem(last=False)
+    return result
+
+
+@dataclass(slots=True)
+class ContentValidation:
+    is_suspicious: bool = False
+    flags: list[str] = field(default_factory=list)
+    risk_level: str = "none"  # none, low, medium, high
+    patterns_found: int = 0
+
+
+def _build_validation(counts: tuple[tuple[int, int], ...]) -> ContentValidation:
+    result = ContentValidation()
+    for idx, count in counts:
+        result.flags.append(f"Pattern: {INJECTION_PATTERNS[idx][:60]}")
+        result.patterns_found += count
 
     if result.patterns_found > 0:
         result.is_suspicious = True
@@ -71,8 +130,67 @@ def validate_repo_content(content: str) -> ContentValidation:
     return result
 
 
+def _truncate_and_scan(content: str) -> _ScanResult:
+    if len(content) > MAX_FIELD_LENGTH:
+        content = content[:MAX_FIELD_LENGTH]
+
+    if not _may_contain_injection(content):
+        return content, 0, ()
+
+    result = _scan(content)
+    for idx, _ in result[2]:
+        logger.warning(
+            f"Prompt injection pattern found: {INJECTION_PATTERNS[idx][:50]}"
+        )
+    return result
+
+
+def scan_repo_content(content: str) -> tuple[str, ContentValidation]:
+    """Truncate, sanitize and validate content with one shared scan.
+
+    The validation describes the truncated content that was sanitized.
+    """
+    if not content:
+        return content, ContentValidation()
+
+    sanitized, _, counts = _truncate_and_scan(content)
+    return sanitized, _build_validation(counts)
+
+
+def sanitize_repo_content(content: str) -> str:
+    """Strip known prompt injection patterns and truncate."""
+    return sanitize_repo_content_with_count(content)[0]
+
+
+def sanitize_repo_content_with_count(content: str) -> tuple[str, int]:
+    """Like sanitize_repo_content, also returning the number of redactions."""
+    if not content:
+        return content, 0
+
+    sanitized, redactions, _ = _truncate_and_scan(content)
+    return sanitized, redactions
+
+
+def validate_repo_content(content: str) -> ContentValidation:
+    """Check for suspicious patterns without modifying content.
+
+    Only the first MAX_FIELD_LENGTH characters are checked, matching what
+    sanitize_repo_content keeps.
+    """
+    if content and len(content) > MAX_FIELD_LENGTH:
+        content = content[:MAX_FIELD_LENGTH]
+
+    if not content or not _may_contain_injection(content):
+        return ContentValidation()
+
+    return _build_validation(_scan(content)[2])
+
+
 def _escape_delimiter_tags(content: str) -> str:
     """Escape XML delimiter tags to prevent prompt injection breakout."""
+    # Two scans rule out the common case before the four replace passes.
+    if "repo_content>" not in content and "evaluation_instructions>" not in content:
+        return content
     return (
         content.replace("</repo_content>", "&lt;/repo_content&gt;")
         .replace("<repo_content>", "&lt;repo_content&gt;")
@@ -28,6 +28,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, AsyncIterator, Optional
 
+import orjson
+
 if TYPE_CHECKING:
     pass
 
@@ -35,19 +37,26 @@ logger = logging.getLogger(__name__)
 
 PENDING_EVENTS_MAX_SIZE = 50
 PENDING_EVENTS_MAX_AGE_SECONDS = 30.0
-CRITICAL_EVENT_TYPES = {
-    "sommelier_error",
-    "evaluation_complete",
-    "evaluation_error",
-    "technique_error",
-    "enrichment_error",
-}
+CRITICAL_EVENT_TYPES: frozenset[str] = frozenset(
+    {
+        "sommelier_error",
+        "evaluation_complete",
+        "evaluation_error",
+        "technique_error",
+        "enrichment_error",
+    }
+)
 TRANSFER_LOOP_INTERVAL_SECONDS = 0.01
 TRANSFER_BATCH_SIZE = 10
 STALE_CHANNEL_MAX_AGE_SECONDS = 600.0
 HEARTBEAT_TIMEOUT_SECONDS = 30.0
 
 
+def _format_sse(payload: dict) -> bytes:
+    """Frame a JSON payload as a single SSE data message."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
 class EventType(str, Enum):
     """Event types for sommelier progress streaming."""
 
@@ -73,6 +82,14 @@ class EventType(str, Enum):
     ENRICHMENT_ERROR = "enrichment_error"
 
 
+_EVENT_TYPES_BY_VALUE: dict[str, EventType] = {e.value: e for e in EventType}
+
+
+def _event_type(value: str) -> EventType:
+    """Resolve an event type string, raising ValueError if it is unknown."""
+    return _EVENT_TYPES_BY_VALUE.get(value) or EventType(value)
+
+
 @dataclass
 class SommelierProgressEvent:
     """Event data structure for sommelier progress updates.
@@ -96,6 +113,9 @@ class SommelierProgressEvent:
     tokens_used: int = 0
     cost_usd: float = 0.0
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _sse_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Convert event to JSON-serializable dictionary."""
@@ -110,8 +130,14 @@ class SommelierProgressEvent:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    def to_sse_bytes(self) -> bytes:
+        """Serialize the event as an SSE frame, once per event."""
+        if self._sse_bytes is None:
+            self._sse_bytes = _format_sse(self.to_dict())
+        return self._sse_bytes
 
-@dataclass
+
+@dataclass(slots=True)
 class SSEEvent:
     """Event data structure for technique-level progress updates.
 
@@ -126,6 +152,9 @@ class SSEEvent:
     event_type: EventType
     data: dict = field(default_factory=dict)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _sse_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> dict:
         """Convert event to JSON-serializable dictionary."""
@@ -136,6 +165,12 @@ class SSEEvent:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    def to_sse_bytes(self) -> bytes:
+        """Serialize the event as an SSE frame, once per event."""
+        if self._sse_bytes is None:
+            self._sse_bytes = _format_sse(self.to_dict())
+        return self._sse_bytes
+
 
 class EventChannel:
     """2-stage event channel: sync → async bridge for SSE streaming.
@@ -154,7 +189,7 @@ class EventChannel:
 
         # In SSE endpoint (async context):
         async for event in event_channel.subscribe(eval_id):
-            yield f"data: {json.dumps(event.to_dict())}\\n\\n"
+            yield event.to_sse_bytes()
     """
 
     def __init__(self) -> None:
@@ -550,7 +585,7 @@ def create_sommelier_event(
     """
     return SommelierProgressEvent(
         evaluation_id=evaluation_id,
-        event_type=EventType(event_type),
+        event_type=_event_type(event_type),
         sommelier=sommelier,
         message=message or f"{sommelier} {event_type}",
         progress_percent=progress_percent,
@@ -576,7 +611,7 @@ def create_technique_event(
     """Create a technique-level SSE event."""
     return SSEEvent(
         evaluation_id=evaluation_id,
-        event_type=EventType(event_type),
+        event_type=_event_type(event_type),
         data={
             "technique_id": technique_id,
             "technique_name": technique_name,
@@ -3,7 +3,37 @@ import time
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ProgressSnapshot:
+    """Consistent copy of ProgressTracker counters taken under one lock."""
+
+    total: int
+    completed: int
+    in_progress: int
+    failed: int
+    duration_sum_ms: int
+    duration_count: int
+    elapsed_ns: int
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self.elapsed_ns / 1e9
+
+    @property
+    def progress_percent(self) -> float:
+        done = self.completed + self.failed
+        return (done / self.total * 100) if self.total > 0 else 0
+
+    def eta_seconds(self, max_concurrent: int) -> float | None:
+        if not self.duration_count:
+            return None
+        avg_ms = self.duration_sum_ms / self.duration_count
+        remaining = self.total - self.completed - self.failed
+        batches = (remaining + max_concurrent - 1) // max_concurrent
+        return (batches * avg_ms) / 1000
+
+
+@dataclass(slots=True)
 class ProgressTracker:
     """Thread-safe progress tracker for full_techniques evaluation."""
 
@@ -12,11 +42,12 @@ class ProgressTracker:
     _completed: int = field(default=0, init=False)
     _in_progress: int = field(default=0, init=False)
     _failed: int = field(default=0, init=False)
-    _durations: list = field(default_factory=list, init=False)
+    _duration_sum_ms: int = field(default=0, init=False)
+    _duration_count: int = field(default=0, init=False)
     _lock: threading.Lock = field(
         default_factory=threading.Lock, init=False, repr=False
     )
-    _start_time: float = field(default_factory=time.time, init=False)
+    _start_ns: int = field(default_factory=time.monotonic_ns, init=False)
 
     def technique_started(self) -> None:
         with self._lock:
@@ -24,14 +55,15 @@ class ProgressTracker:
 
     def technique_completed(self, duration_ms: int = 0) -> None:
         with self._lock:
-            self._in_progress = max(0, self._in_progress - 1)
+            self._in_progress -= self._in_progress > 0
             self._completed += 1
             if duration_ms > 0:
-                self._durations.append(duration_ms)
+                self._duration_sum_ms += duration_ms
+                self._duration_count += 1
 
     def technique_failed(self) -> None:
         with self._lock:
-            self._in_progress = max(0, self._in_progress - 1)
+            self._in_progress -= self._in_progress > 0
             self._failed += 1
 
     @property
@@ -49,44 +81,34 @@ class ProgressTracker:
         with self._lock:
             return self._failed
 
-    @property
-    def progress_percent(self) -> float:
+    def snapshot(self) -> ProgressSnapshot:
         with self._lock:
-            done = self._completed + self._failed
-            return (
-                (done / self.total_techniques * 100) if self.total_techniques > 0 else 0
+            return ProgressSnapshot(
+                total=self.total_techniques,
+                completed=self._completed,
+                in_progress=self._in_progress,
+                failed=self._failed,
+                duration_sum_ms=self._duration_sum_ms,
+                duration_count=self._duration_count,
+                elapsed_ns=time.monotonic_ns() - self._start_ns,
             )
 
+    @property
+    def progress_percent(self) -> float:
+        return self.snapshot().progress_percent
+
     @property
     def eta_seconds(self) -> float | None:
-        with self._lock:
-            if not self._durations:
-                return None
-            avg_ms = sum(self._durations) / len(self._durations)
-            remaining = self.total_techniques - self._completed - self._failed
-            batches = (remaining + self.max_concurrent - 1) // self.max_concurrent
-            return (batches * avg_ms) / 1000
+        return self.snapshot().eta_seconds(self.max_concurrent)
 
     def summary(self) -> dict:
-        with self._lock:
-            elapsed = time.time() - self._start_time
-            done = self._completed + self._failed
-            progress_pct = (
-                (done / self.total_techniques * 100) if self.total_techniques > 0 else 0
-            )
-            if self._durations:
-                avg_ms = sum(self._durations) / len(self._durations)
-                remaining = self.total_techniques - done
-                batches = (remaining + self.max_concurrent - 1) // self.max_concurrent
-                eta = (batches * avg_ms) / 1000
-            else:
-                eta = None
-            return {
-                "total": self.total_techniques,
-                "completed": self._completed,
-                "in_progress": self._in_progress,
-                "failed": self._failed,
-                "progress_percent": round(progress_pct, 1),
-                "eta_seconds": eta,
-                "elapsed_seconds": round(elapsed, 1),
-            }
+        snap = self.snapshot()
+        return {
+            "total": snap.total,
+            "completed": snap.completed,
+            "in_progress": snap.in_progress,
+            "failed": snap.failed,
+            "progress_percent": round(snap.progress_percent, 1),
+            "eta_seconds": snap.eta_seconds(self.max_concurrent),
+            "elapsed_seconds": round(snap.elapsed_seconds, 1),
+        }
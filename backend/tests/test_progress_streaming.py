@@ -1,3 +1,4 @@
+import json
 import threading
 import time
 
@@ -112,6 +113,22 @@ class TestCreateTechniqueEvent:
         assert result["data"]["technique_name"] == "Test Technique"
         assert "timestamp" in result
 
+    def test_create_technique_event_rejects_unknown_type(self):
+        with pytest.raises(ValueError):
+            create_technique_event(evaluation_id="eval_abc", event_type="bogus")
+
+    def test_create_technique_event_to_sse_bytes(self):
+        event = create_technique_event(
+            evaluation_id="eval_abc",
+            event_type="technique_complete",
+            technique_id="t1",
+        )
+        frame = event.to_sse_bytes()
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        assert json.loads(frame[len(b"data: ") :]) == event.to_dict()
+        assert event.to_sse_bytes() is frame
+
 
 class TestProgressTracker:
     def test_progress_tracker_starts_at_zero(self):
@@ -260,6 +277,17 @@ class TestProgressTracker:
         summary = tracker.summary()
         assert summary["progress_percent"] == 33.3
 
+    def test_snapshot_matches_summary(self):
+        tracker = ProgressTracker(total_techniques=10, max_concurrent=2)
+        tracker.technique_completed(duration_ms=1000)
+        tracker.technique_failed()
+
+        snap = tracker.snapshot()
+        summary = tracker.summary()
+        assert (snap.completed, snap.failed) == (1, 1)
+        assert summary["progress_percent"] == round(snap.progress_percent, 1)
+        assert summary["eta_seconds"] == snap.eta_seconds(tracker.max_concurrent)
+
     def test_summary_elapsed_seconds_increases_over_time(self):
         tracker = ProgressTracker()
         summary1 = tracker.summary()
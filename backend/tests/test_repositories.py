@@ -4,15 +4,9 @@ Tests for repositories.
 RED Phase: These tests should FAIL initially because the repositories don't exist yet.
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
 
-# Add the backend directory to the Python path
-backend_path = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_path))
-
 
 class TestRepositoryImports:
     """Test that repositories can be imported correctly"""
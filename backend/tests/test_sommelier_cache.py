@@ -0,0 +1,126 @@
+"""Tests for SommelierResultCache and its use in BaseSommelierNode.evaluate."""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.graph.nodes.cache import SommelierResultCache, get_sommelier_cache
+from app.graph.nodes.isabella import IsabellaNode
+from tests.mocks.providers import MockLLM
+from tests.mocks.state import make_state
+
+MESSAGES = [SystemMessage(content="You are Isabella."), HumanMessage(content="repo")]
+
+
+@pytest.fixture
+def cache():
+    """Fixture providing a fresh SommelierResultCache instance."""
+    return SommelierResultCache(ttl_hours=24, max_entries=2)
+
+
+def _key(**overrides):
+    args = {
+        "sommelier": "isabella",
+        "provider": "gemini",
+        "model": None,
+        "temperature": None,
+        "max_output_tokens": 2048,
+        "messages": MESSAGES,
+    }
+    args.update(overrides)
+    return SommelierResultCache.make_key(**args)
+
+
+class TestSommelierResultCache:
+    """Test cache keys, lookups, expiry and eviction."""
+
+    def test_key_is_stable(self):
+        """Identical inputs should produce the same key."""
+        assert _key() == _key()
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"sommelier": "laurent"},
+            {"provider": "openai"},
+            {"model": "gemini-2.0-flash"},
+            {"temperature": 0.2},
+            {"max_output_tokens": 1024},
+            {"messages": MESSAGES[:1]},
+        ],
+    )
+    def test_key_changes_with_inputs(self, override):
+        """Any change to the prompt or model settings should change the key."""
+        assert _key(**override) != _key()
+
+    def test_miss_returns_none(self, cache):
+        """Cache miss should return None."""
+        assert cache.get(_key()) is None
+
+    def test_set_then_get_returns_copy(self, cache):
+        """Cached results should be returned as independent copies."""
+        cache.set(_key(), {"score": 90, "aspects": {"elegance": 88}})
+        result = cache.get(_key())
+        result["aspects"]["elegance"] = 0
+        assert cache.get(_key()) == {"score": 90, "aspects": {"elegance": 88}}
+
+    def test_expired_entry_is_dropped(self, cache):
+        """Entries older than the TTL should be treated as misses."""
+        cache.set(_key(), {"score": 90})
+        stale = datetime.now(timezone.utc) - timedelta(hours=25)
+        cache._cache[_key()]["created_at"] = stale
+        assert cache.get(_key()) is None
+        assert _key() not in cache._cache
+
+    def test_oldest_entry_is_evicted(self, cache):
+        """Exceeding max_entries should evict the least recently used key."""
+        cache.set(_key(provider="a"), {"score": 1})
+        cache.set(_key(provider="b"), {"score": 2})
+        cache.get(_key(provider="a"))
+        cache.set(_key(provider="c"), {"score": 3})
+        assert cache.get(_key(provider="b")) is None
+        assert cache.get(_key(provider="a")) == {"score": 1}
+
+
+class TestEvaluateWithCache:
+    """Test that evaluate short-circuits on a cache hit."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_cache(self):
+        get_sommelier_cache().clear()
+        with patch("app.graph.nodes.base.settings.SOMMELIER_CACHE_ENABLED", True):
+            yield
+        get_sommelier_cache().clear()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_second_identical_evaluate_skips_llm(self):
+        """A repeated evaluation with the same state should not call the LLM."""
+        mock_llm = MockLLM(
+            response='{"score": 90, "notes": "Elegant", "confidence": 0.95, "techniques_used": [], "aspects": {}}'
+        )
+        node = IsabellaNode()
+        with patch("app.graph.nodes.base.build_llm", return_value=mock_llm):
+            first = await node.evaluate(make_state())
+            second = await node.evaluate(make_state())
+
+        assert mock_llm.call_count == 1
+        assert second["isabella_result"] == first["isabella_result"]
+        assert second["trace_metadata"]["isabella"]["from_cache"] is True
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_disabled_cache_always_calls_llm(self):
+        """With the setting off, every evaluation should reach the LLM."""
+        mock_llm = MockLLM(
+            response='{"score": 90, "notes": "Elegant", "confidence": 0.95, "techniques_used": [], "aspects": {}}'
+        )
+        node = IsabellaNode()
+        with (
+            patch("app.graph.nodes.base.settings.SOMMELIER_CACHE_ENABLED", False),
+            patch("app.graph.nodes.base.build_llm", return_value=mock_llm),
+        ):
+            await node.evaluate(make_state())
+            await node.evaluate(make_state())
+
+        assert mock_llm.call_count == 2
@@ -0,0 +1,292 @@
+"""Table-driven tests for the six sommelier nodes.
+
+Issues #13 (Marcel), #14 (Isabella), #15 (Heinrich), #16 (Sofia),
+#17 (Laurent) and #18 (Jean-Pierre).
+"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import patch
+from langchain_core.prompts import ChatPromptTemplate
+from app.graph.nodes.base import BaseSommelierNode
+from app.graph.nodes.heinrich import HeinrichNode
+from app.graph.nodes.isabella import IsabellaNode
+from app.graph.nodes.jeanpierre import JeanPierreNode
+from app.graph.nodes.laurent import LaurentNode
+from app.graph.nodes.marcel import MarcelNode
+from app.graph.nodes.sofia import SofiaNode
+from tests.mocks.providers import MockLLM, MockLLMWithError
+from tests.mocks.state import BASE_STATE, BASE_STATE_WITH_PRIORS, make_state
+
+NODES = [
+    pytest.param(
+        MarcelNode,
+        "marcel",
+        "Cellar Master",
+        ("cellar",),
+        ("structure", "architecture"),
+        id="marcel",
+    ),
+    pytest.param(
+        IsabellaNode,
+        "isabella",
+        "Wine Critic",
+        ("critic",),
+        ("aesthetic", "elegance"),
+        id="isabella",
+    ),
+    pytest.param(
+        HeinrichNode,
+        "heinrich",
+        "Quality Inspector",
+        ("quality",),
+        ("test", "security"),
+        id="heinrich",
+    ),
+    pytest.param(
+        SofiaNode,
+        "sofia",
+        "Vineyard Scout",
+        ("scout",),
+        ("innovation", "growth"),
+        id="sofia",
+    ),
+    pytest.param(
+        LaurentNode,
+        "laurent",
+        "Winemaker",
+        ("winemaker",),
+        ("implementation", "algorithm"),
+        id="laurent",
+    ),
+    pytest.param(
+        JeanPierreNode,
+        "jeanpierre",
+        "Master Sommelier",
+        ("sommelier",),
+        ("synthes", "final"),
+        id="jeanpierre",
+    ),
+]
+
+
+def _evaluation(node_cls, name, payload, state=BASE_STATE):
+    """Table row with the mocked LLM content serialized once at import."""
+    return pytest.param(node_cls, name, payload, json.dumps(payload), state, id=name)
+
+
+def _basic_prompt(node):
+    """A node's basic prompt and its lowercased system message."""
+    prompt = node.get_prompt("basic")
+    system_lower = prompt.messages[0].prompt.template.lower()
+    return SimpleNamespace(prompt=prompt, system_lower=system_lower)
+
+
+EVALUATIONS = [
+    _evaluation(
+        MarcelNode,
+        "marcel",
+        {
+            "score": 85,
+            "notes": "Excellent vintage",
+            "confidence": 0.9,
+            "techniques_used": ["structure_analysis"],
+            "aspects": {"architecture": 85, "organization": 88},
+        },
+    ),
+    _evaluation(
+        IsabellaNode,
+        "isabella",
+        {
+            "score": 90,
+            "notes": "A masterpiece of elegance",
+            "confidence": 0.95,
+            "techniques_used": ["aesthetics_review"],
+            "aspects": {"readability": 92, "elegance": 88},
+        },
+    ),
+    _evaluation(
+        HeinrichNode,
+        "heinrich",
+        {
+            "score": 78,
+            "notes": "Requires more testing",
+            "confidence": 0.85,
+            "techniques_used": ["security_scan", "test_coverage"],
+            "aspects": {"test_coverage": 75, "security": 80},
+        },
+    ),
+    _evaluation(
+        SofiaNode,
+        "sofia",
+        {
+            "score": 88,
+            "notes": "Promising vintage with great potential",
+            "confidence": 0.87,
+            "techniques_used": ["innovation_scan", "tech_analysis"],
+            "aspects": {"innovation": 90, "modernity": 85},
+        },
+    ),
+    _evaluation(
+        LaurentNode,
+        "laurent",
+        {
+            "score": 82,
+            "notes": "Well-crafted with careful attention to detail",
+            "confidence": 0.91,
+            "techniques_used": ["code_review", "algorithm_analysis"],
+            "aspects": {"implementation": 85, "performance": 79},
+        },
+    ),
+    _evaluation(
+        JeanPierreNode,
+        "jeanpierre",
+        {
+            "total_score": 85,
+            "rating": "Premier Cru",
+            "verdict": "An exceptional vintage with perfect balance",
+            "pairing_suggestions": ["synthesis", "harmonization"],
+            "cellaring_advice": "Age gracefully with more tests",
+            "aspect_scores": {"balance": 90, "complexity": 85, "finish": 80},
+        },
+        BASE_STATE_WITH_PRIORS,
+    ),
+]
+
+_SOMMELIER_RE = re.compile(r"\b(Marcel|Isabella|Heinrich|Sofia|Laurent)\b")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def llm_holder():
+    """Patch build_llm once per module; tests set holder["llm"] to the double."""
+    holder = {"llm": None}
+
+    def _build(*args, **kwargs):
+        return holder["llm"]
+
+    with (
+        patch("app.graph.nodes.base.build_llm", side_effect=_build),
+        patch("app.graph.nodes.jeanpierre.build_llm", side_effect=_build),
+    ):
+        yield holder
+
+
+@pytest.mark.parametrize("node_cls,name,role,role_themes,focus_themes", NODES)
+class TestSommelierNode:
+    """Contract and prompt tests shared by every sommelier node."""
+
+    def test_node_contract(self, node_cls, name, role, role_themes, focus_themes):
+        """Test a freshly built node's name, role, parser and base class."""
+        node = node_cls()
+
+        assert node.name == name
+        assert node.role == role
+        assert hasattr(node, "parser")
+        assert isinstance(node, BaseSommelierNode)
+
+    def test_get_prompt_returns_chat_prompt_template(
+        self, sommelier_node, node_cls, name, role, role_themes, focus_themes
+    ):
+        """Test that get_prompt returns ChatPromptTemplate."""
+        prompt = sommelier_node(node_cls).get_prompt("basic")
+        assert isinstance(prompt, ChatPromptTemplate)
+
+    def test_get_prompt_is_memoized(
+        self, sommelier_node, node_cls, name, role, role_themes, focus_themes
+    ):
+        """Test that repeated get_prompt calls reuse the built template."""
+        node = sommelier_node(node_cls)
+        assert node.get_prompt("basic") is node.get_prompt("basic")
+
+    def test_prompt_contains_role_theme(
+        self, sommelier_node, node_cls, name, role, role_themes, focus_themes
+    ):
+        """Test that the system message speaks in the node's role."""
+        basic = _basic_prompt(sommelier_node(node_cls))
+
+        assert len(basic.prompt.messages) >= 2
+        assert all(theme in basic.system_lower for theme in role_themes)
+
+    def test_prompt_covers_focus(
+        self, sommelier_node, node_cls, name, role, role_themes, focus_themes
+    ):
+        """Test that the system message covers the node's focus area."""
+        basic = _basic_prompt(sommelier_node(node_cls))
+        assert any(theme in basic.system_lower for theme in focus_themes)
+
+
+def _make_llm(behavior, content):
+    if behavior == "success":
+        return MockLLM(response=content)
+    return MockLLMWithError("API error")
+
+
+def _assert_success(result, name, payload):
+    assert result[f"{name}_result"] == payload
+    assert "errors" not in result
+
+
+def _assert_error(result, name, payload):
+    assert len(result["errors"]) > 0
+    assert f"{name} evaluation failed" in result["errors"][0]
+    assert result[f"{name}_result"] is None
+
+
+@pytest.mark.parametrize(
+    "behavior,assert_fn",
+    [
+        pytest.param("success", _assert_success, id="success"),
+        pytest.param("error", _assert_error, id="error"),
+    ],
+)
+@pytest.mark.parametrize("node_cls,name,payload,content,state", EVALUATIONS)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_evaluate(
+    sommelier_node,
+    llm_holder,
+    node_cls,
+    name,
+    payload,
+    content,
+    state,
+    behavior,
+    assert_fn,
+):
+    """Test evaluate on a parsed LLM response and on an LLM failure."""
+    llm_holder["llm"] = _make_llm(behavior, content)
+    result = await sommelier_node(node_cls).evaluate(make_state(state))
+
+    assert name in result["completed_sommeliers"]
+    assert_fn(result, name, payload)
+
+
+@pytest.fixture(scope="module")
+def jeanpierre_basic_prompt(sommelier_node):
+    """Jean-Pierre's basic prompt and its lowercased system message."""
+    return _basic_prompt(sommelier_node(JeanPierreNode))
+
+
+class TestJeanPierrePrompt:
+    """Jean-Pierre specific prompt tests."""
+
+    def test_jeanpierre_prompt_includes_all_sommeliers(self, jeanpierre_basic_prompt):
+        """Test that Jean-Pierre's prompt includes references to all sommeliers."""
+        system = jeanpierre_basic_prompt.prompt.messages[0]
+        found = set(_SOMMELIER_RE.findall(system.prompt.template))
+        assert found == {"Marcel", "Isabella", "Heinrich", "Sofia", "Laurent"}
+
+    def test_jeanpierre_system_message_is_static(self, jeanpierre_basic_prompt):
+        """Test that per-call results stay out of the cacheable system prefix."""
+        system, human = jeanpierre_basic_prompt.prompt.messages[:2]
+
+        assert system.prompt.input_variables == ["format_instructions"]
+        assert {
+            "marcel_result",
+            "isabella_result",
+            "heinrich_result",
+            "sofia_result",
+            "laurent_result",
+        } <= set(human.prompt.input_variables)